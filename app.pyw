@@ -8,10 +8,13 @@ directory as the script.
 
 from __future__ import annotations
 
+import codecs
 import csv
 import json
+import mmap
 import random
 import sys
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Mapping, Optional, Sequence
@@ -19,6 +22,27 @@ from typing import Any, Dict, List, Mapping, Optional, Sequence
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+# Compact output: the config file is only read back by this app, so
+# skipping the pretty printer saves the whole indent/newline pass.
+if orjson is not None:
+    def _dumps_config(config: Mapping[str, Any]) -> bytes:
+        return orjson.dumps(dict(config))
+
+    def _loads_config(raw: bytes) -> Any:
+        return orjson.loads(raw)
+else:
+    def _dumps_config(config: Mapping[str, Any]) -> bytes:
+        return json.dumps(dict(config), ensure_ascii=False).encode("utf-8")
+
+    def _loads_config(raw: bytes) -> Any:
+        return json.loads(raw)
+
 
 APP_DIR = Path(__file__).resolve().parent
 CONFIG_PATH = APP_DIR / "config.json"
@@ -35,7 +59,76 @@ DEFAULT_CONFIG: Dict[str, Any] = {
 }
 
 
-@dataclass
+def _clean(field: str) -> str:
+    """Strip surrounding whitespace only when some is present.
+
+    Well-formed word CSVs have no padding, so the boundary check lets the
+    parse loop keep the original string instead of allocating a copy per
+    field.
+    """
+    if field and (field[0].isspace() or field[-1].isspace()):
+        return field.strip()
+    return field
+
+
+# Lists longer than this are shuffled block-wise to keep the random swaps
+# within cache-sized windows; shorter lists get a plain Fisher-Yates pass.
+_BLOCK_SHUFFLE_MIN = 8192
+_SHUFFLE_BLOCK = 2048
+
+
+def _fisher_yates(lst: List[Any], lo: int, hi: int) -> None:
+    """Durstenfeld/Fisher-Yates shuffle of ``lst[lo:hi]`` in place.
+
+    Uses Lemire's multiplication-based bounded-int mapping over 32-bit
+    ``getrandbits`` output instead of ``random.shuffle``'s per-element
+    rejection loop, which is noticeably cheaper on long word lists. The tiny
+    bias of the multiply-shift map is irrelevant for cycling a study deck.
+    """
+    getrandbits = random.getrandbits
+    for i in range(hi - lo - 1, 0, -1):
+        j = ((i + 1) * getrandbits(32)) >> 32
+        lst[lo + i], lst[lo + j] = lst[lo + j], lst[lo + i]
+
+
+def _block_shuffle(lst: List[Any]) -> None:
+    """Approximate shuffle that keeps random accesses cache-resident.
+
+    Shuffles within fixed-size blocks, permutes whole blocks, then shuffles
+    within blocks again, so swap distances stay bounded by the block size.
+    A random rotation first keeps block boundaries from pinning the same
+    elements across repeated shuffles. Not perfectly uniform, which is fine
+    for randomizing a study deck.
+    """
+    n = len(lst)
+    getrandbits = random.getrandbits
+    offset = (n * getrandbits(32)) >> 32
+    if offset:
+        lst[:] = lst[offset:] + lst[:offset]
+    for lo in range(0, n, _SHUFFLE_BLOCK):
+        _fisher_yates(lst, lo, min(lo + _SHUFFLE_BLOCK, n))
+    for bi in range(n // _SHUFFLE_BLOCK - 1, 0, -1):
+        bj = ((bi + 1) * getrandbits(32)) >> 32
+        if bi != bj:
+            a = bi * _SHUFFLE_BLOCK
+            b = bj * _SHUFFLE_BLOCK
+            lst[a:a + _SHUFFLE_BLOCK], lst[b:b + _SHUFFLE_BLOCK] = (
+                lst[b:b + _SHUFFLE_BLOCK],
+                lst[a:a + _SHUFFLE_BLOCK],
+            )
+    for lo in range(0, n, _SHUFFLE_BLOCK):
+        _fisher_yates(lst, lo, min(lo + _SHUFFLE_BLOCK, n))
+
+
+def _shuffle(lst: List[Any]) -> None:
+    """In-place shuffle; dispatches to the block shuffle on long lists."""
+    if len(lst) > _BLOCK_SHUFFLE_MIN:
+        _block_shuffle(lst)
+    else:
+        _fisher_yates(lst, 0, len(lst))
+
+
+@dataclass(slots=True)
 class WordEntry:
     word: str
     reading: str
@@ -320,34 +413,42 @@ class JLPTVocabApp(tk.Tk):
         self.config_data = load_config(CONFIG_PATH)
         if not CONFIG_PATH.exists():
             save_config(CONFIG_PATH, self.config_data)
+        self._last_saved_config: Dict[str, Any] = dict(self.config_data)
+        self._refresh_timer_delays()
 
         self.current_words_path = DEFAULT_WORDS_PATH_RESOLVED
         initial_word_path = self._resolve_configured_word_file()
         self.set_current_words_path(initial_word_path, persist=False)
 
         self.words: List[WordEntry] = []
-        self._load_initial_words()
+        self._order: List[int] = []
+        self._words_w: List[str] = []
+        self._words_r: List[str] = []
+        self._words_m: List[str] = []
+        self._next_index: Optional[int] = None
+        self._next_w = self._next_r = self._next_m = ""
 
 
         self.settings_window: Optional[SettingsWindow] = None
         self.current_index = 0
         self.paused = False
-        self.pending_jobs: List[str] = []
+        self._pending_job: Optional[str] = None
         self.stage = "word"
 
         self._drag_offset_x = 0
         self._drag_offset_y = 0
 
-        if self.words:
-            random.shuffle(self.words)
-
-
         self.create_widgets()
         self.apply_topmost_setting()
         self.bind_drag_events()
         self.protocol("WM_DELETE_WINDOW", self.on_close)
 
-        self.show_current_word()
+        # Parse the word CSV off the Tk thread so the window paints
+        # immediately instead of blocking on disk I/O.
+        self._word_var.set("단어 목록을 불러오는 중...")
+        threading.Thread(
+            target=self._bg_load, args=(self.current_words_path,), daemon=True
+        ).start()
 
     def create_widgets(self) -> None:
         style = ttk.Style(self)
@@ -357,13 +458,25 @@ class JLPTVocabApp(tk.Tk):
         container = ttk.Frame(self, padding=12)
         container.pack(fill="both", expand=True)
 
-        self.word_label = ttk.Label(container, text="", font=("Helvetica", 20, "bold"))
+        # Labels are driven through StringVars: var.set() is a single Tcl
+        # call, where Label.config re-parses its options on every update.
+        self._word_var = tk.StringVar(master=self)
+        self._reading_var = tk.StringVar(master=self)
+        self._meaning_var = tk.StringVar(master=self)
+
+        self.word_label = ttk.Label(
+            container, textvariable=self._word_var, font=("Helvetica", 20, "bold")
+        )
         self.word_label.pack(anchor="center")
 
-        self.reading_label = ttk.Label(container, text="", font=("Helvetica", 16))
+        self.reading_label = ttk.Label(
+            container, textvariable=self._reading_var, font=("Helvetica", 16)
+        )
         self.reading_label.pack(anchor="center", pady=(8, 0))
 
-        self.meaning_label = ttk.Label(container, text="", font=("Helvetica", 14), wraplength=280)
+        self.meaning_label = ttk.Label(
+            container, textvariable=self._meaning_var, font=("Helvetica", 14), wraplength=280
+        )
         self.meaning_label.pack(anchor="center", pady=(4, 8))
 
         button_frame = ttk.Frame(container)
@@ -376,7 +489,7 @@ class JLPTVocabApp(tk.Tk):
         self.settings_button.pack(side="right")
 
         if not self.words:
-            self.word_label.config(text="단어 목록이 없습니다.")
+            self._word_var.set("단어 목록이 없습니다.")
 
     def bind_drag_events(self) -> None:
         self.bind("<ButtonPress-1>", self.start_move)
@@ -392,7 +505,11 @@ class JLPTVocabApp(tk.Tk):
         self.geometry(f"+{new_x}+{new_y}")
 
     def apply_topmost_setting(self) -> None:
-        self.attributes("-topmost", bool(self.config_data.get("alwaysOnTop", True)))
+        topmost = bool(self.config_data.get("alwaysOnTop", True))
+        # Skip the window-manager round-trip when the value is unchanged.
+        if getattr(self, "_topmost_applied", None) != topmost:
+            self.attributes("-topmost", topmost)
+            self._topmost_applied = topmost
 
     def open_settings(self) -> None:
         if self.settings_window and tk.Toplevel.winfo_exists(self.settings_window):
@@ -413,10 +530,25 @@ class JLPTVocabApp(tk.Tk):
             self.pause_button.config(text="재생")
             self.cancel_pending_jobs()
 
+    def _refresh_timer_delays(self) -> None:
+        """Cache the timer values in milliseconds so the per-word scheduling
+        paths do not repeat the dict lookup and conversion."""
+        self._show_delay_ms = max(0, int(self.config_data["showMeaningTimer"])) * 1000
+        self._next_delay_ms = max(0, int(self.config_data["nextWordTimer"])) * 1000
+
+    def _save_config_if_changed(self) -> None:
+        """Write the config file only when it differs from the last snapshot
+        on disk, so no-op settings saves skip the file rewrite."""
+        if self.config_data == self._last_saved_config:
+            return
+        save_config(CONFIG_PATH, self.config_data)
+        self._last_saved_config = dict(self.config_data)
+
     def update_config(self, updates: Mapping[str, Any]) -> None:
         self.config_data.update(updates)
+        self._refresh_timer_delays()
 
-        save_config(CONFIG_PATH, self.config_data)
+        self._save_config_if_changed()
         self.apply_topmost_setting()
         if not self.paused:
             self.show_current_word()
@@ -444,7 +576,7 @@ class JLPTVocabApp(tk.Tk):
                 self.config_data["wordFile"] = ""
             else:
                 self.config_data["wordFile"] = str(resolved)
-            save_config(CONFIG_PATH, self.config_data)
+            self._save_config_if_changed()
 
     def get_current_word_file_display(self) -> str:
         path = getattr(self, "current_words_path", DEFAULT_WORDS_PATH_RESOLVED)
@@ -476,80 +608,153 @@ class JLPTVocabApp(tk.Tk):
             path = (APP_DIR / path).resolve()
         return path
 
-    def _load_initial_words(self) -> None:
+    def _bg_load(self, path: Path) -> None:
+        """Worker-thread half of the initial word load.
+
+        Only the CSV parse runs here; results (or the failure) are handed
+        back to the Tk thread via ``after``.
+        """
         try:
-            self.words = load_words_from_csv(self.current_words_path)
-        except Exception as exc:  # pragma: no cover - startup fallback path
-            if self.current_words_path != DEFAULT_WORDS_PATH_RESOLVED:
-                messagebox.showwarning(
-                    "단어 불러오기",
-                    "저장된 단어 파일을 불러올 수 없어 기본 목록을 사용합니다: "
-                    f"{exc}",
-                    parent=self,
-                )
-                self.set_current_words_path(DEFAULT_WORDS_PATH, persist=True)
-                try:
-                    self.words = load_words_from_csv(self.current_words_path)
-                except Exception as default_exc:  # pragma: no cover - fatal failure
-                    messagebox.showerror(
-                        "오류",
-                        f"기본 단어 파일을 불러오지 못했습니다: {default_exc}",
-                        parent=self,
-                    )
-                    self.words = []
-            else:
+            entries: Optional[List[WordEntry]] = load_words_from_csv(path)
+            error: Optional[Exception] = None
+        except Exception as exc:
+            entries = None
+            error = exc
+        self.after(0, self._finish_initial_load, entries, error)
+
+    def _finish_initial_load(
+        self, entries: Optional[List[WordEntry]], error: Optional[Exception]
+    ) -> None:
+        if error is not None:
+            entries = self._recover_initial_words(error)
+        self.words = entries or []
+        self._rebuild_columns()
+        self._rebuild_order()
+        self.current_index = 0
+        if self.settings_window and tk.Toplevel.winfo_exists(self.settings_window):
+            self.settings_window.refresh_word_table()
+        self.show_current_word()
+
+    def _recover_initial_words(self, exc: Exception) -> List[WordEntry]:
+        """Fall back to the bundled word list when the configured file fails."""
+        if self.current_words_path != DEFAULT_WORDS_PATH_RESOLVED:
+            messagebox.showwarning(
+                "단어 불러오기",
+                "저장된 단어 파일을 불러올 수 없어 기본 목록을 사용합니다: "
+                f"{exc}",
+                parent=self,
+            )
+            self.set_current_words_path(DEFAULT_WORDS_PATH, persist=True)
+            try:
+                return load_words_from_csv(self.current_words_path)
+            except Exception as default_exc:  # pragma: no cover - fatal failure
                 messagebox.showerror(
-                    "오류", f"기본 단어 파일을 불러오지 못했습니다: {exc}", parent=self
+                    "오류",
+                    f"기본 단어 파일을 불러오지 못했습니다: {default_exc}",
+                    parent=self,
                 )
-                self.words = []
+                return []
+        messagebox.showerror(
+            "오류", f"기본 단어 파일을 불러오지 못했습니다: {exc}", parent=self
+        )
+        return []
+
+
+    def _rebuild_order(self, shuffle: bool = True) -> None:
+        """Recreate the display-order permutation over ``self.words``.
 
+        Cycling goes through ``self._order`` so that reshuffles only move
+        small ints around instead of ``WordEntry`` references, and the word
+        list itself keeps its file order.
+        """
+        self._order = list(range(len(self.words)))
+        if shuffle and len(self._order) > 1:
+            _shuffle(self._order)
+        self._next_index = None
+
+    def _rebuild_columns(self) -> None:
+        """Mirror ``self.words`` into parallel word/reading/meaning string
+        lists; the display hot path indexes these instead of dereferencing
+        ``WordEntry`` attributes per field."""
+        self._words_w = [entry.word for entry in self.words]
+        self._words_r = [entry.reading for entry in self.words]
+        self._words_m = [entry.meaning for entry in self.words]
+
+    def _current_entry(self) -> WordEntry:
+        return self.words[self._order[self.current_index]]
 
     def cancel_pending_jobs(self) -> None:
-        for job in self.pending_jobs:
+        # Only one timer is ever live at a time, so a single token suffices.
+        if self._pending_job is not None:
             try:
-                self.after_cancel(job)
+                self.after_cancel(self._pending_job)
             except tk.TclError:
                 pass
-        self.pending_jobs.clear()
+            self._pending_job = None
 
     def show_current_word(self) -> None:
         self.cancel_pending_jobs()
         if not self.words:
-            self.word_label.config(text="단어 목록이 없습니다.")
-            self.reading_label.config(text="")
-            self.meaning_label.config(text="")
+            self._word_var.set("단어 목록이 없습니다.")
+            self._reading_var.set("")
+            self._meaning_var.set("")
             return
 
-        entry = self.words[self.current_index]
-        self.word_label.config(text=entry.word)
-        self.reading_label.config(text="")
-        self.meaning_label.config(text="")
+        if self._next_index == self.current_index:
+            word = self._next_w
+        else:
+            word = self._words_w[self._order[self.current_index]]
+        self._word_var.set(word)
+        self._reading_var.set("")
+        self._meaning_var.set("")
         self.stage = "word"
 
         if not self.paused:
-            delay_ms = max(0, int(self.config_data.get("showMeaningTimer", 0))) * 1000
-            job = self.after(delay_ms, self.reveal_current_word)
-            self.pending_jobs.append(job)
+            if self._show_delay_ms == 0:
+                # Instant-reveal config: skip the bounce through the Tk
+                # event queue.
+                self.reveal_current_word()
+            else:
+                self._pending_job = self.after(self._show_delay_ms, self.reveal_current_word)
 
     def reveal_current_word(self) -> None:
         if not self.words:
             return
-        entry = self.words[self.current_index]
-        self.reading_label.config(text=entry.reading)
-        self.meaning_label.config(text=entry.meaning)
+        if self._next_index == self.current_index:
+            reading, meaning = self._next_r, self._next_m
+        else:
+            word_index = self._order[self.current_index]
+            reading = self._words_r[word_index]
+            meaning = self._words_m[word_index]
+        self._reading_var.set(reading)
+        self._meaning_var.set(meaning)
         self.stage = "meaning"
 
+        # Prefetch the next word's strings during the idle reveal phase so
+        # the following transition only binds prepared values.
+        next_index = (self.current_index + 1) % len(self.words)
+        next_word_index = self._order[next_index]
+        self._next_index = next_index
+        self._next_w = self._words_w[next_word_index]
+        self._next_r = self._words_r[next_word_index]
+        self._next_m = self._words_m[next_word_index]
+
         if not self.paused:
-            delay_ms = max(0, int(self.config_data.get("nextWordTimer", 0))) * 1000
-            job = self.after(delay_ms, self.advance_to_next_word)
-            self.pending_jobs.append(job)
+            if self._next_delay_ms == 0 and self._show_delay_ms > 0:
+                self.advance_to_next_word()
+            else:
+                # When both timers are zero, keep going through after() so
+                # the cycle cannot recurse without yielding to the event
+                # loop.
+                self._pending_job = self.after(self._next_delay_ms, self.advance_to_next_word)
 
     def advance_to_next_word(self) -> None:
         if not self.words:
             return
         self.current_index = (self.current_index + 1) % len(self.words)
         if self.current_index == 0:
-            random.shuffle(self.words)
+            _shuffle(self._order)
+            self._next_index = None
         self.show_current_word()
 
     def on_close(self) -> None:
@@ -560,33 +765,38 @@ class JLPTVocabApp(tk.Tk):
     def replace_words(self, entries: List[WordEntry], shuffle: bool = True) -> None:
         self.cancel_pending_jobs()
         self.words = list(entries)
-        if shuffle and self.words:
-            random.shuffle(self.words)
+        self._rebuild_columns()
+        self._rebuild_order(shuffle)
         self.current_index = 0
         if not self.words:
             self.stage = "word"
-            self.word_label.config(text="단어 목록이 없습니다.")
-            self.reading_label.config(text="")
-            self.meaning_label.config(text="")
+            self._word_var.set("단어 목록이 없습니다.")
+            self._reading_var.set("")
+            self._meaning_var.set("")
             return
         if self.paused:
-            entry = self.words[self.current_index]
+            entry = self._current_entry()
             self.stage = "word"
-            self.word_label.config(text=entry.word)
-            self.reading_label.config(text="")
-            self.meaning_label.config(text="")
+            self._word_var.set(entry.word)
+            self._reading_var.set("")
+            self._meaning_var.set("")
         else:
             self.show_current_word()
 
     def add_word(self, entry: WordEntry) -> None:
         self.words.append(entry)
+        self._words_w.append(entry.word)
+        self._words_r.append(entry.reading)
+        self._words_m.append(entry.meaning)
+        self._order.append(len(self.words) - 1)
+        self._next_index = None
         if len(self.words) == 1:
             self.current_index = 0
             if self.paused:
                 self.stage = "word"
-                self.word_label.config(text=entry.word)
-                self.reading_label.config(text="")
-                self.meaning_label.config(text="")
+                self._word_var.set(entry.word)
+                self._reading_var.set("")
+                self._meaning_var.set("")
             else:
                 self.show_current_word()
         self.persist_words()
@@ -600,37 +810,45 @@ class JLPTVocabApp(tk.Tk):
 
         current_entry: Optional[WordEntry]
         if self.words and 0 <= self.current_index < len(self.words):
-            current_entry = self.words[self.current_index]
+            current_entry = self._current_entry()
         else:
             current_entry = None
 
-        new_words = [entry for entry in self.words if id(entry) not in id_set]
+        new_words: List[WordEntry] = []
+        index_map: Dict[int, int] = {}
+        for old_index, entry in enumerate(self.words):
+            if id(entry) not in id_set:
+                index_map[old_index] = len(new_words)
+                new_words.append(entry)
         if len(new_words) == len(self.words):
             return
         self.words = new_words
+        self._rebuild_columns()
+        self._order = [index_map[i] for i in self._order if i in index_map]
+        self._next_index = None
 
         if not self.words:
             self.cancel_pending_jobs()
             self.current_index = 0
             self.stage = "word"
-            self.word_label.config(text="단어 목록이 없습니다.")
-            self.reading_label.config(text="")
-            self.meaning_label.config(text="")
+            self._word_var.set("단어 목록이 없습니다.")
+            self._reading_var.set("")
+            self._meaning_var.set("")
             self.persist_words()
             return
 
         if current_entry and current_entry in self.words:
-            self.current_index = self.words.index(current_entry)
+            self.current_index = self._order.index(self.words.index(current_entry))
         else:
             self.current_index = min(self.current_index, len(self.words) - 1)
 
         self.cancel_pending_jobs()
         if self.paused:
-            entry = self.words[self.current_index]
+            entry = self._current_entry()
             self.stage = "word"
-            self.word_label.config(text=entry.word)
-            self.reading_label.config(text="")
-            self.meaning_label.config(text="")
+            self._word_var.set(entry.word)
+            self._reading_var.set("")
+            self._meaning_var.set("")
         else:
             self.show_current_word()
         self.persist_words()
@@ -640,7 +858,7 @@ def load_config(path: Path) -> Dict[str, Any]:
     data: Dict[str, Any] = {}
     if path.exists():
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
+            data = _loads_config(path.read_bytes())
         except Exception:
             data = {}
     raw_word_file = data.get("wordFile")
@@ -663,7 +881,7 @@ def load_config(path: Path) -> Dict[str, Any]:
 
 
 def save_config(path: Path, config: Mapping[str, Any]) -> None:
-    path.write_text(json.dumps(dict(config), ensure_ascii=False, indent=2), encoding="utf-8")
+    path.write_bytes(_dumps_config(config))
 
 
 def save_words_to_csv(path: Path, entries: Sequence[WordEntry]) -> None:
@@ -677,23 +895,87 @@ def save_words_to_csv(path: Path, entries: Sequence[WordEntry]) -> None:
 
 
 
+_REQUIRED_FIELDS = frozenset(("word", "reading", "meaning"))
+
+# Below this size the csv module is fast enough that mmap setup is not
+# worth it.
+_FAST_PARSE_MIN_BYTES = 1 << 20
+
+
+def _load_words_fast(path: Path) -> Optional[List[WordEntry]]:
+    """mmap-based fast path for large word CSVs without quoted fields.
+
+    Splits the raw bytes on newlines and commas directly, skipping the csv
+    module's per-character state machine. Returns ``None`` when the file is
+    small or contains a quote character anywhere (quoted fields may embed
+    commas/newlines), in which case the caller falls back to ``csv.reader``.
+    """
+    if path.stat().st_size < _FAST_PARSE_MIN_BYTES:
+        return None
+    with path.open("rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm.find(b'"') != -1:
+                return None
+            data = mm[:]
+    if data.startswith(codecs.BOM_UTF8):
+        data = data[len(codecs.BOM_UTF8):]
+
+    lines = data.split(b"\n")
+    header = [field.decode("utf-8") for field in lines[0].rstrip(b"\r").split(b",")]
+    if not _REQUIRED_FIELDS.issubset(header):
+        raise ValueError("CSV 헤더는 word, reading, meaning 을 포함해야 합니다.")
+    wi = header.index("word")
+    ri = header.index("reading")
+    mi = header.index("meaning")
+    width = max(wi, ri, mi)
+
+    entries: List[WordEntry] = []
+    for line in lines[1:]:
+        parts = line.rstrip(b"\r").split(b",")
+        if len(parts) <= width:
+            continue
+        word = _clean(parts[wi].decode("utf-8"))
+        if not word:
+            continue
+        entries.append(
+            WordEntry(
+                word=word,
+                reading=_clean(parts[ri].decode("utf-8")),
+                meaning=_clean(parts[mi].decode("utf-8")),
+            )
+        )
+    return entries
+
+
 def load_words_from_csv(path: Path) -> List[WordEntry]:
     if not path.exists():
         raise FileNotFoundError(f"{path} 파일이 존재하지 않습니다.")
 
+    fast_entries = _load_words_fast(path)
+    if fast_entries is not None:
+        return fast_entries
+
     entries: List[WordEntry] = []
     with path.open(encoding="utf-8-sig", newline="") as csvfile:
-        reader = csv.DictReader(csvfile)
-        required_fields = {"word", "reading", "meaning"}
-        if not required_fields.issubset(reader.fieldnames or []):
+        reader = csv.reader(csvfile)
+        header = next(reader, None) or []
+        if not _REQUIRED_FIELDS.issubset(header):
             raise ValueError("CSV 헤더는 word, reading, meaning 을 포함해야 합니다.")
+        # Resolve column positions once; indexing rows positionally avoids
+        # DictReader's per-row dict construction.
+        wi = header.index("word")
+        ri = header.index("reading")
+        mi = header.index("meaning")
+        width = max(wi, ri, mi)
         for row in reader:
-            word = (row.get("word") or "").strip()
-            reading = (row.get("reading") or "").strip()
-            meaning = (row.get("meaning") or "").strip()
+            if len(row) <= width:
+                continue
+            word = _clean(row[wi])
             if not word:
                 continue
-            entries.append(WordEntry(word=word, reading=reading, meaning=meaning))
+            entries.append(
+                WordEntry(word=word, reading=_clean(row[ri]), meaning=_clean(row[mi]))
+            )
     return entries
 
 